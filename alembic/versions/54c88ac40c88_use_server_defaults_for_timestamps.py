@@ -0,0 +1,52 @@
+"""use server defaults for timestamps
+
+Revision ID: 54c88ac40c88
+Revises: a58645645d31
+Create Date: 2026-08-30 11:49:38.422152
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "54c88ac40c88"
+down_revision: str | Sequence[str] | None = "a58645645d31"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TIMESTAMP_COLUMNS = {
+    "sources": ["created_at", "updated_at"],
+    "puzzles": ["created_at", "updated_at"],
+    "agent_tasks": ["queued_at"],
+    "users": ["created_at"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in _TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    server_default=sa.text("CURRENT_TIMESTAMP"),
+                    existing_nullable=False,
+                )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in _TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    server_default=None,
+                    existing_nullable=False,
+                )
@@ -0,0 +1,35 @@
+"""add agent tasks pending index
+
+Revision ID: a58645645d31
+Revises: e37f11e44c89
+Create Date: 2026-08-30 11:47:40.381866
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a58645645d31"
+down_revision: str | Sequence[str] | None = "e37f11e44c89"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_agent_tasks_pending",
+        "agent_tasks",
+        ["queued_at"],
+        sqlite_where=sa.text("status = 'pending'"),
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_agent_tasks_pending", table_name="agent_tasks")
@@ -0,0 +1,33 @@
+"""add agent tasks source indexes
+
+Revision ID: b91f24c36aa7
+Revises: e5d71607f881
+Create Date: 2026-08-30 15:41:17.903255
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b91f24c36aa7"
+down_revision: str | Sequence[str] | None = "e5d71607f881"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_agent_tasks_source_queued", "agent_tasks", ["source_id", "queued_at"]
+    )
+    op.create_index(
+        "ix_agent_tasks_source_status", "agent_tasks", ["source_id", "status"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_agent_tasks_source_status", table_name="agent_tasks")
+    op.drop_index("ix_agent_tasks_source_queued", table_name="agent_tasks")
@@ -0,0 +1,27 @@
+"""add puzzles source date index
+
+Revision ID: e37f11e44c89
+Revises: eb3f502822d1
+Create Date: 2026-08-30 11:46:06.621823
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e37f11e44c89"
+down_revision: str | Sequence[str] | None = "eb3f502822d1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_puzzles_source_date", "puzzles", ["source_id", "puzzle_date"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_puzzles_source_date", table_name="puzzles")
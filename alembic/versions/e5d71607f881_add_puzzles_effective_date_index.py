@@ -0,0 +1,33 @@
+"""add puzzles effective date index
+
+Revision ID: e5d71607f881
+Revises: 54c88ac40c88
+Create Date: 2026-08-30 15:02:41.118204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5d71607f881"
+down_revision: str | Sequence[str] | None = "54c88ac40c88"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_puzzles_source_effective_date",
+        "puzzles",
+        ["source_id", sa.text("COALESCE(puzzle_date, DATE(created_at))")],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_puzzles_source_effective_date", table_name="puzzles")
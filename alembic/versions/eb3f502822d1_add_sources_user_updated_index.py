@@ -0,0 +1,27 @@
+"""add sources user updated index
+
+Revision ID: eb3f502822d1
+Revises: 342af1a1f122
+Create Date: 2026-08-30 11:42:18.014593
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "eb3f502822d1"
+down_revision: str | Sequence[str] | None = "342af1a1f122"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_sources_user_updated", "sources", ["user_id", "updated_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_sources_user_updated", table_name="sources")
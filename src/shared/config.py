@@ -86,10 +86,14 @@ class Settings:
     # This is set from the TZ environment variable only
     TZ_TIMEZONE: str = os.getenv("TZ", "America/New_York")
 
+    # Production mode (set PROD=1) skips template auto-reload mtime checks
+    PROD: bool = os.getenv("PROD", "") == "1"
+
     def __init__(self) -> None:
         """Ensure directories exist."""
         self.config_path.mkdir(parents=True, exist_ok=True)
         self.puzzles_path.mkdir(parents=True, exist_ok=True)
+        self._puzzles_path_str = str(self.puzzles_path)
 
     @property
     def config_path(self) -> Path:
@@ -107,6 +111,11 @@ class Settings:
         """Get the puzzles directory path."""
         return self.DATA_PATH / "puzzles"
 
+    @property
+    def puzzles_path_str(self) -> str:
+        """Get the puzzles directory path as a cached string."""
+        return self._puzzles_path_str
+
 
 # Global settings instance
 settings = Settings()
@@ -14,8 +14,12 @@ engine = create_engine(
     connect_args={"check_same_thread": False},  # Needed for SQLite
 )
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create SessionLocal class. expire_on_commit=False keeps attributes
+# loaded after commit, so post-commit reads (e.g. the new row's id in a
+# redirect URL) don't trigger a refresh SELECT.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 # Create Base class for models
 Base = declarative_base()
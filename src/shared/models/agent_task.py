@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import uuid
-from datetime import UTC, datetime
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.shared.database import Base
+from src.shared.ids import uuid7
 
 if TYPE_CHECKING:
     from src.shared.models.source import Source
@@ -19,9 +19,23 @@ class AgentTask(Base):
     """Task queue for agent execution."""
 
     __tablename__ = "agent_tasks"
+    __table_args__ = (
+        # Partial index covering only the small pending working set, so
+        # queue polling stays an index scan as completed tasks accumulate
+        Index(
+            "ix_agent_tasks_pending",
+            "queued_at",
+            sqlite_where=text("status = 'pending'"),
+            postgresql_where=text("status = 'pending'"),
+        ),
+        # Run-history listing: filter by source, newest first
+        Index("ix_agent_tasks_source_queued", "source_id", "queued_at"),
+        # has_running_agent existence check on (source_id, status)
+        Index("ix_agent_tasks_source_status", "source_id", "status"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=lambda: str(uuid7())
     )
     source_id: Mapped[str] = mapped_column(
         ForeignKey("sources.id", ondelete="CASCADE"), nullable=False
@@ -30,7 +44,7 @@ class AgentTask(Base):
         String, nullable=False, default="pending"
     )  # pending, running, completed, failed
     queued_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(UTC)
+        DateTime, nullable=False, server_default=func.now()
     )
     started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import uuid
-from datetime import UTC, datetime
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Integer, String, Uuid
+from sqlalchemy import DateTime, Integer, String, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.shared.database import Base
@@ -29,7 +29,7 @@ class User(Base):
         Uuid, unique=True, index=True, nullable=False, default=uuid.uuid4
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(UTC)
+        DateTime, nullable=False, server_default=func.now()
     )
 
     sources: Mapped[list[Source]] = relationship("Source", back_populates="user")
@@ -1,8 +1,20 @@
 """Request-related utility functions."""
 
+from functools import lru_cache
+
 from fastapi import Request
 
 
+@lru_cache(maxsize=32)
+def _base_url_for(scheme: str, netloc: str) -> str:
+    """Build a base URL for a scheme/host pair.
+
+    Deployments see a handful of distinct host headers at most, so this
+    is effectively a dict hit after the first request per host.
+    """
+    return f"{scheme}://{netloc}"
+
+
 def get_base_url(request: Request) -> str:
     """Get the base URL for the application.
 
@@ -15,4 +27,10 @@ def get_base_url(request: Request) -> str:
     Returns:
         Base URL string (e.g., "http://localhost:8000" or "https://example.com")
     """
-    return f"{request.url.scheme}://{request.url.netloc}"
+    # Memoized on request.state so repeated calls within one request skip
+    # the URL parsing and string formatting
+    base_url = getattr(request.state, "_base_url", None)
+    if base_url is None:
+        base_url = _base_url_for(request.url.scheme, request.url.netloc)
+        request.state._base_url = base_url
+    return base_url
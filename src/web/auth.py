@@ -1,13 +1,16 @@
 """Authentication utilities for password hashing and verification."""
 
+import threading
+import time
 import uuid
 from collections.abc import Callable
 from functools import wraps
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
 from fastapi import Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse
-from passlib.hash import pbkdf2_sha256  # type: ignore
+from passlib.context import CryptContext  # type: ignore
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from src.shared.database import get_db
@@ -58,9 +61,17 @@ def require_auth(func: Callable[..., Any]) -> Callable[..., Any]:
     return wrapper
 
 
+# Argon2id for new hashes; pbkdf2_sha256 stays verifiable so existing
+# users keep working and get upgraded lazily on their next login.
+_pwd_context = CryptContext(
+    schemes=["argon2", "pbkdf2_sha256"],
+    deprecated=["pbkdf2_sha256"],
+)
+
+
 def hash_password(password: str) -> str:
     """
-    Hash a password using pbkdf2_sha256.
+    Hash a password using Argon2id.
 
     Args:
         password: Plain text password to hash
@@ -68,7 +79,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return cast(str, pbkdf2_sha256.hash(password))
+    return cast(str, _pwd_context.hash(password))
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -82,7 +93,43 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return cast(bool, pbkdf2_sha256.verify(plain_password, hashed_password))
+    return cast(bool, _pwd_context.verify(plain_password, hashed_password))
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verify a password and rehash it if the stored hash is outdated.
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to compare against
+
+    Returns:
+        Tuple of (valid, new_hash); new_hash is None unless the password
+        verified against a deprecated scheme and should be re-persisted
+    """
+    valid, new_hash = _pwd_context.verify_and_update(plain_password, hashed_password)
+    return cast(bool, valid), cast(str | None, new_hash)
+
+
+# Compiled once at import time so per-request lookups skip rebuilding the
+# expression tree (SQLAlchemy caches the compiled SQL keyed on this object).
+_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+
+
+def get_user_by_username(db: Session, username: str) -> User | None:
+    """Look up a user by username.
+
+    Args:
+        db: Database session
+        username: Username to look up
+
+    Returns:
+        User if found, None otherwise
+    """
+    return db.scalars(_USER_BY_USERNAME, {"username": username}).first()
 
 
 def get_user_from_key(key: str, db: Session = Depends(get_db)) -> User:
@@ -138,7 +185,34 @@ def user_has_puzzle_access(user: User, puzzle: Puzzle) -> bool:
     return puzzle.source_id in source_ids
 
 
-def get_user_from_session(request: Request, db: Session) -> User:
+class SessionUser(NamedTuple):
+    """Immutable snapshot of the session user's stable columns."""
+
+    id: int
+    username: str
+    feed_key: uuid.UUID
+
+
+# Short-TTL cache for session-user lookups. User rows change rarely and
+# handlers only need the stable columns above, so this collapses the
+# per-request SELECT on every authenticated endpoint.
+_SESSION_USER_TTL = 30.0
+_SESSION_USER_MAXSIZE = 1024
+_session_user_cache: dict[int, tuple[float, SessionUser]] = {}
+_session_user_lock = threading.Lock()
+
+
+def invalidate_session_user(user_id: int) -> None:
+    """Drop a user's cached session snapshot (e.g. on logout or mutation).
+
+    Args:
+        user_id: ID of the user to evict from the cache
+    """
+    with _session_user_lock:
+        _session_user_cache.pop(user_id, None)
+
+
+def get_user_from_session(request: Request, db: Session) -> SessionUser:
     """Get authenticated user from session.
 
     Args:
@@ -146,20 +220,40 @@ def get_user_from_session(request: Request, db: Session) -> User:
         db: Database session
 
     Returns:
-        Authenticated User
+        Snapshot of the authenticated user
 
     Raises:
         HTTPException: If user not found
     """
+    # Request-scoped memo: decorators and handlers both resolve the user,
+    # so later calls within one request skip the lock and cache entirely
+    memoized = getattr(request.state, "_session_user", None)
+    if memoized is not None:
+        return memoized
+
     user_id = request.session.get("user_id")
     if not user_id:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    user = db.query(User).filter(User.id == user_id).first()
+    now = time.monotonic()
+    with _session_user_lock:
+        cached = _session_user_cache.get(user_id)
+        if cached and cached[0] > now:
+            request.state._session_user = cached[1]
+            return cached[1]
+
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
 
-    return user
+    snapshot = SessionUser(id=user.id, username=user.username, feed_key=user.feed_key)
+    with _session_user_lock:
+        if len(_session_user_cache) >= _SESSION_USER_MAXSIZE:
+            _session_user_cache.clear()
+        _session_user_cache[user_id] = (now + _SESSION_USER_TTL, snapshot)
+
+    request.state._session_user = snapshot
+    return snapshot
 
 
 def has_any_users(db: Session) -> bool:
@@ -1,43 +1,10 @@
 """Utilities for building JSON feeds and managing feed data."""
 
+import os
+
 from src.shared.models.puzzle import Puzzle
 from src.shared.models.source import Source
 from src.web.feed_types import PuzzleCastFeed, PuzzleCastItem
-from src.web.pagination_utils import paginate
-
-
-def sort_puzzles_by_date(puzzles: list[Puzzle]) -> list[Puzzle]:
-    """Sort puzzles by date, most recent first.
-
-    Puzzles without dates are sorted by creation date.
-
-    Args:
-        puzzles: List of puzzles to sort
-
-    Returns:
-        Sorted list of puzzles
-    """
-    return sorted(
-        puzzles,
-        key=lambda p: p.puzzle_date if p.puzzle_date else p.created_at,
-        reverse=True,
-    )
-
-
-def paginate_items(
-    items: list[Puzzle], page: int, per_page: int = 50
-) -> tuple[list[Puzzle], int, int]:
-    """Paginate a list of puzzles.
-
-    Args:
-        items: List of puzzles to paginate
-        page: Current page number (1-indexed)
-        per_page: Number of items per page
-
-    Returns:
-        Tuple of (paginated_items, total_pages, validated_page)
-    """
-    return paginate(items, page, per_page)
 
 
 def build_puzzle_content_text(puzzle: Puzzle) -> str:
@@ -57,18 +24,51 @@ def build_puzzle_content_text(puzzle: Puzzle) -> str:
     return " • ".join(content_parts)
 
 
-def build_feed_item(puzzle: Puzzle, base_url: str, feed_key: str) -> PuzzleCastItem:
+def scan_preview_paths(puzzles: list[Puzzle]) -> set[str]:
+    """Scan puzzle folders once for existing preview images.
+
+    One scandir per folder replaces a stat per puzzle when building a
+    feed page.
+
+    Args:
+        puzzles: Puzzles whose folders should be scanned
+
+    Returns:
+        Set of paths to existing .preview.png files
+    """
+    preview_paths: set[str] = set()
+    for folder in {os.path.dirname(p.file_path) for p in puzzles}:
+        try:
+            entries = os.scandir(folder)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.endswith(".preview.png"):
+                    preview_paths.add(entry.path)
+    return preview_paths
+
+
+def build_feed_item(
+    puzzle: Puzzle,
+    puzzle_url_prefix: str,
+    key_query: str,
+    preview_paths: set[str] | None = None,
+) -> PuzzleCastItem:
     """Build a JSON feed item for a puzzle.
 
     Args:
         puzzle: The puzzle to build an item for
-        base_url: Base URL for constructing absolute URLs
-        feed_key: Feed key for authentication
+        puzzle_url_prefix: Absolute URL prefix for puzzle routes,
+            e.g. "https://host/puzzles/"
+        key_query: Feed-key query string, e.g. "?key=abc"
+        preview_paths: Pre-scanned preview paths (see scan_preview_paths);
+            falls back to a per-puzzle stat when omitted
 
     Returns:
         Dictionary representing the feed item
     """
-    item_url = f"{base_url}/puzzles/{puzzle.id}?key={feed_key}"
+    item_url = puzzle_url_prefix + puzzle.id + key_query
 
     item: PuzzleCastItem = {
         "id": item_url,
@@ -77,7 +77,7 @@ def build_feed_item(puzzle: Puzzle, base_url: str, feed_key: str) -> PuzzleCastI
         "content_text": build_puzzle_content_text(puzzle),
         "attachments": [
             {
-                "url": f"{base_url}/puzzles/{puzzle.id}.puz?key={feed_key}",
+                "url": puzzle_url_prefix + puzzle.id + ".puz" + key_query,
                 "mime_type": "application/x-crossword",
             }
         ],
@@ -89,8 +89,12 @@ def build_feed_item(puzzle: Puzzle, base_url: str, feed_key: str) -> PuzzleCastI
     if puzzle.puzzle_date:
         item["date_published"] = f"{puzzle.puzzle_date.isoformat()}T00:00:00Z"
 
-    if puzzle.has_preview():
-        item["image"] = f"{base_url}/puzzles/{puzzle.id}.preview.png"
+    if preview_paths is not None:
+        has_preview = puzzle.preview_path_str() in preview_paths
+    else:
+        has_preview = puzzle.has_preview()
+    if has_preview:
+        item["image"] = puzzle_url_prefix + puzzle.id + ".preview.png"
 
     return item
 
@@ -118,13 +122,22 @@ def build_feed_data(
     """
     feed_identifier = source.short_code if source.short_code else source.id
 
+    preview_paths = scan_preview_paths(puzzles)
+
+    # Hoist the strings every item URL shares out of the per-item loop
+    puzzle_url_prefix = f"{base_url}/puzzles/"
+    key_query = f"?key={feed_key}"
+
     feed_data: PuzzleCastFeed = {
         "version": "https://jsonfeed.org/version/1.1",
         "title": source.name,
         "home_page_url": f"{base_url}/sources/{source.id}",
-        "feed_url": f"{base_url}/feeds/{feed_identifier}.json?key={feed_key}",
+        "feed_url": f"{base_url}/feeds/{feed_identifier}.json{key_query}",
         "description": f"A Puzzlecast feed for source: {source.name}",
-        "items": [build_feed_item(puzzle, base_url, feed_key) for puzzle in puzzles],
+        "items": [
+            build_feed_item(puzzle, puzzle_url_prefix, key_query, preview_paths)
+            for puzzle in puzzles
+        ],
     }
 
     icon_url = source.icon_url(base_url)
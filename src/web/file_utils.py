@@ -0,0 +1,58 @@
+"""Utilities for serving files with HTTP caching."""
+
+import os
+from pathlib import Path
+
+from fastapi import Request
+from fastapi.responses import FileResponse
+from starlette.responses import Response as StarletteResponse
+
+
+def cached_file_response(
+    request: Request,
+    path: Path | str,
+    stat_result: os.stat_result,
+    media_type: str,
+    max_age: int,
+    immutable: bool = False,
+    private: bool = False,
+    filename: str | None = None,
+    inline: bool = False,
+) -> StarletteResponse:
+    """Serve a file with cache headers, answering conditional GETs with 304.
+
+    Args:
+        request: The incoming request (checked for If-None-Match)
+        path: Path to the file on disk
+        stat_result: Result of os.stat for the file (avoids a re-stat)
+        media_type: MIME type for the response
+        max_age: Cache-Control max-age in seconds
+        immutable: Whether to mark the response immutable
+        private: Whether to restrict caching to the requesting client
+        filename: Download filename (sets Content-Disposition: attachment)
+        inline: Whether to set Content-Disposition: inline
+
+    Returns:
+        304 response if the client's ETag matches, otherwise a FileResponse
+    """
+    etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    cache_control = f"{'private' if private else 'public'}, max-age={max_age}"
+    if immutable:
+        cache_control += ", immutable"
+
+    if request.headers.get("if-none-match") == etag:
+        return StarletteResponse(
+            status_code=304, headers={"ETag": etag, "Cache-Control": cache_control}
+        )
+
+    headers = {"Content-Disposition": "inline"} if inline else None
+    response = FileResponse(
+        path=path,
+        media_type=media_type,
+        stat_result=stat_result,
+        filename=filename,
+        headers=headers,
+    )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    return response
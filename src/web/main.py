@@ -1,15 +1,19 @@
+import bisect
 import time
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from zoneinfo import ZoneInfo
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from starlette.middleware.sessions import SessionMiddleware
 
 from src.shared.config import settings
 from src.web.routers.feed_router import feed_router
 from src.web.routers.web_ui_router import web_ui_router
+from src.web.templating import templates
 
 app = FastAPI()
 
@@ -19,28 +23,69 @@ app.add_middleware(
     max_age=settings.SESSION_MAX_AGE,
 )
 
+# Feed JSON and HTML pages are full of repeated URLs and field names;
+# responses under minimum_size skip compression. GZipMiddleware does not
+# inspect content types, so .puz and preview downloads over 1KB get
+# gzipped too — wasted but cheap at this level, and clients that omit
+# Accept-Encoding: gzip still receive the raw bytes.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 CACHE_BUSTER = str(int(time.time()))
 
-templates = Jinja2Templates(directory="src/web/templates")
+# ZoneInfo construction parses tzdata; build these once instead of per
+# rendered row
+_USER_TZ = ZoneInfo(settings.TZ_TIMEZONE)
+_UTC = ZoneInfo("UTC")
+
+_DEFAULT_FORMAT = "%b %d, %Y %I:%M:%S %p"
+# fmt: off
+_MONTHS = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+# fmt: on
+
+# Unit boundaries for time_ago: seconds below each limit map to the
+# divisor/name at the same index, anything past the last limit is days
+_TIME_AGO_LIMITS = (3600, 86400)
+_TIME_AGO_UNITS = ((60, "minute"), (3600, "hour"), (86400, "day"))
+
 templates.env.globals["cache_buster"] = CACHE_BUSTER
 
 
-def format_datetime(
-    dt: datetime | None, format_str: str = "%b %d, %Y %I:%M:%S %p"
-) -> str:
+def format_datetime(dt: datetime | None, format_str: str = _DEFAULT_FORMAT) -> str:
     """Format datetime with timezone awareness, converting to user's timezone."""
     if dt is None:
         return "N/A"
+    return _format_datetime_cached(dt, format_str)
+
 
-    # Get the user's timezone from settings
-    user_tz = ZoneInfo(settings.TZ_TIMEZONE)
+@lru_cache(maxsize=4096)
+def _format_datetime_cached(dt: datetime, format_str: str) -> str:
+    """Memoized core of format_datetime.
 
+    Feed and detail pages render many rows sharing the same timestamps,
+    so identical (dt, format_str) pairs hit the cache instead of
+    re-converting and re-formatting.
+    """
     # If datetime is naive (no timezone info), assume UTC
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
+        dt = dt.replace(tzinfo=_UTC)
 
     # Convert to user's timezone
-    dt_user_tz = dt.astimezone(user_tz)
+    dt_user_tz = dt.astimezone(_USER_TZ)
+
+    if format_str is _DEFAULT_FORMAT:
+        # Fast path for the default format: direct attribute reads skip
+        # strftime's timetuple expansion and locale machinery
+        hour = dt_user_tz.hour
+        ampm = "AM" if hour < 12 else "PM"
+        hour12 = hour % 12 or 12
+        return (
+            f"{_MONTHS[dt_user_tz.month - 1]} {dt_user_tz.day:02d}, "
+            f"{dt_user_tz.year} {hour12:02d}:{dt_user_tz.minute:02d}:"
+            f"{dt_user_tz.second:02d} {ampm}"
+        )
 
     return dt_user_tz.strftime(format_str)
 
@@ -52,41 +97,33 @@ def time_ago(dt: datetime | None) -> str:
 
     # If datetime is naive (no timezone info), assume UTC
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
+        dt = dt.replace(tzinfo=_UTC)
 
-    now = datetime.now(ZoneInfo("UTC"))
-    diff = dt - now
-
-    # Get total seconds (positive for future, negative for past)
-    total_seconds = diff.total_seconds()
+    # Epoch arithmetic instead of aware-datetime subtraction: no second
+    # datetime to build and no utcoffset() consultations per call
+    total_seconds = dt.timestamp() - time.time()
     abs_seconds = abs(total_seconds)
 
     # Determine if future or past
     is_future = total_seconds > 0
-    prefix = "in " if is_future else ""
-    suffix = "" if is_future else " ago"
 
-    # Calculate time units
     if abs_seconds < 60:
-        return "just now" if not is_future else "in a few seconds"
-    elif abs_seconds < 3600:
-        minutes = round(abs_seconds / 60)
-        unit = "minute" if minutes == 1 else "minutes"
-        return f"{prefix}{minutes} {unit}{suffix}"
-    elif abs_seconds < 86400:
-        hours = round(abs_seconds / 3600)
-        unit = "hour" if hours == 1 else "hours"
-        return f"{prefix}{hours} {unit}{suffix}"
-    else:
-        days = round(abs_seconds / 86400)
-        unit = "day" if days == 1 else "days"
-        return f"{prefix}{days} {unit}{suffix}"
+        return "in a few seconds" if is_future else "just now"
+
+    divisor, unit = _TIME_AGO_UNITS[bisect.bisect(_TIME_AGO_LIMITS, abs_seconds)]
+    count = round(abs_seconds / divisor)
+    if count != 1:
+        unit += "s"
+    return f"in {count} {unit}" if is_future else f"{count} {unit} ago"
 
 
 templates.env.filters["format_datetime"] = format_datetime
 templates.env.filters["time_ago"] = time_ago
 
-app.mount("/static", StaticFiles(directory="src/web/templates/static"), name="static")
+# Resolve the static root once so per-request path joins start from an
+# absolute path instead of re-resolving the relative directory
+_STATIC_DIR = Path("src/web/templates/static").resolve()
+app.mount("/static", StaticFiles(directory=_STATIC_DIR), name="static")
 
 # Include all routes from routers
 app.include_router(web_ui_router)
@@ -1,27 +1,189 @@
 """Utilities for pagination."""
 
-from typing import TypeVar
+import base64
+import binascii
+from datetime import datetime
+from functools import lru_cache
 
-T = TypeVar("T")
+from markupsafe import Markup, escape
+from sqlalchemy import ColumnElement, String, literal, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
 
 
-def paginate(items: list[T], page: int, per_page: int = 50) -> tuple[list[T], int, int]:
-    """Paginate a list of items.
+def page_bounds(total: int, page: int, per_page: int = 50) -> tuple[int, int, int]:
+    """Compute slicing bounds for a query paginated in SQL.
+
+    Use this when the page rows are fetched with ``LIMIT``/``OFFSET`` and
+    only the page math needs to happen in Python.
 
     Args:
-        items: List of items to paginate
-        page: Current page number (1-indexed)
+        total: Total number of items (e.g. from a SQL ``COUNT(*)``)
+        page: Requested page number (1-indexed)
         per_page: Number of items per page
 
     Returns:
-        Tuple of (paginated_items, total_pages, validated_page)
+        Tuple of (offset, total_pages, validated_page)
     """
-    total = len(items)
     total_pages = (total + per_page - 1) // per_page if total > 0 else 1
-
     validated_page = max(1, min(page, total_pages))
-
     offset = (validated_page - 1) * per_page
-    paginated = items[offset : offset + per_page]
+    return offset, total_pages, validated_page
+
+
+def _storage_timestamp(updated_at: datetime) -> str:
+    """Format a timestamp exactly as SQLite stores it in a DateTime column.
+
+    ``CURRENT_TIMESTAMP`` (our server defaults) writes second precision;
+    values bound from Python carry a six-digit fraction.
+    """
+    if updated_at.microsecond:
+        return updated_at.strftime("%Y-%m-%d %H:%M:%S.%f")
+    return updated_at.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def encode_cursor(updated_at: datetime, id: str) -> str:
+    """Encode a keyset-pagination position as an opaque URL-safe token.
+
+    The timestamp is carried in the database's storage format so the
+    comparison in keyset_filter happens on identical text.
+
+    Args:
+        updated_at: Timestamp of the last row on the current page
+        id: Primary key of the last row on the current page
+
+    Returns:
+        Base64 token suitable for a ?cursor= query parameter
+    """
+    raw = f"{_storage_timestamp(updated_at)}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str] | None:
+    """Decode a token produced by encode_cursor.
+
+    Args:
+        cursor: The opaque token from the query string
+
+    Returns:
+        (timestamp, id) tuple in storage format, or None if malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode()
+        timestamp, sep, id = raw.partition("|")
+        if not sep:
+            return None
+        datetime.fromisoformat(timestamp)  # validate; keep the raw text
+        return timestamp, id
+    except (ValueError, binascii.Error, UnicodeError):
+        return None
+
+
+def keyset_filter(
+    updated_at_col: InstrumentedAttribute[datetime],
+    id_col: InstrumentedAttribute[str],
+    position: tuple[str, str],
+) -> ColumnElement[bool]:
+    """Build the row-value filter for a keyset page bounded by position.
+
+    The timestamp is bound as TEXT rather than as a datetime: SQLite's
+    dialect renders datetime parameters with a microsecond suffix, which
+    sorts after the second-precision values written by CURRENT_TIMESTAMP
+    and would make every same-second row pass the comparison.
+
+    Args:
+        updated_at_col: The timestamp column of the sort key
+        id_col: The unique tiebreaker column of the sort key
+        position: (timestamp, id) pair from decode_cursor
+
+    Returns:
+        Filter clause selecting rows strictly older than position
+    """
+    timestamp, last_id = position
+    return tuple_(updated_at_col, id_col) < tuple_(
+        literal(timestamp, String()), literal(last_id, String())
+    )
+
+
+def render_cursor_pagination(
+    base_path: str, next_cursor: str | None, at_start: bool
+) -> Markup:
+    """Render pagination controls for a keyset-paginated listing.
+
+    Keyset pages have no stable page numbers, so the controls are a link
+    back to the newest page and a link to the next (older) page.
+
+    Args:
+        base_path: Path of the listing, e.g. "/user/1/sources"
+        next_cursor: Cursor for the next page, or None on the last page
+        at_start: Whether this is the first (newest) page
+
+    Returns:
+        Markup fragment; empty when everything fits on one page
+    """
+    if at_start and next_cursor is None:
+        return Markup("")
+
+    path = escape(base_path)
+
+    if at_start:
+        previous = '<span class="btn btn-link pagination-btn disabled">← Newest</span>'
+    else:
+        previous = f'<a href="{path}" class="btn btn-link pagination-btn">← Newest</a>'
+
+    if next_cursor is not None:
+        next_ = (
+            f'<a href="{path}?cursor={escape(next_cursor)}" '
+            f'class="btn btn-link pagination-btn">Older →</a>'
+        )
+    else:
+        next_ = '<span class="btn btn-link pagination-btn disabled">Older →</span>'
+
+    return Markup(f'<div class="pagination">{previous}{next_}</div>')
+
+
+@lru_cache(maxsize=2048)
+def render_pagination(page: int, total_pages: int, base_path: str) -> Markup:
+    """Render pagination controls as a cached HTML fragment.
+
+    Few distinct (page, total_pages, base_path) combinations occur in
+    practice, so rendered fragments are memoized and reused across
+    requests instead of re-templated per render.
+
+    Args:
+        page: Current (validated) page number
+        total_pages: Total number of pages
+        base_path: Path used for the page links, e.g. "/sources/abc"
+
+    Returns:
+        Markup fragment; empty when there is only one page
+    """
+    if total_pages <= 1:
+        return Markup("")
+
+    path = escape(base_path)
+
+    if page > 1:
+        previous = (
+            f'<a href="{path}?page={page - 1}" '
+            f'class="btn btn-link pagination-btn">← Previous</a>'
+        )
+    else:
+        previous = (
+            '<span class="btn btn-link pagination-btn disabled">← Previous</span>'
+        )
+
+    if page < total_pages:
+        next_ = (
+            f'<a href="{path}?page={page + 1}" '
+            f'class="btn btn-link pagination-btn">Next →</a>'
+        )
+    else:
+        next_ = '<span class="btn btn-link pagination-btn disabled">Next →</span>'
 
-    return paginated, total_pages, validated_page
+    return Markup(
+        '<div class="pagination">'
+        f"{previous}"
+        f'<span class="pagination-info">Page {page} of {total_pages}</span>'
+        f"{next_}"
+        "</div>"
+    )
@@ -0,0 +1,103 @@
+"""Tests for keyset pagination helpers."""
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.shared.database import Base
+from src.shared.models.source import Source
+from src.web.pagination_utils import decode_cursor, encode_cursor, keyset_filter
+
+PER_PAGE = 30
+
+
+def _make_session() -> Session:
+    """Create an in-memory database seeded with 35 same-second sources.
+
+    The timestamps are written exactly as SQLite's CURRENT_TIMESTAMP
+    stores them (second precision, no fractional part), matching what the
+    server defaults on the sources table produce.
+    """
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.execute(
+        text(
+            "INSERT INTO users (username, password_hash, feed_key)"
+            " VALUES ('tester', 'x', 'key')"
+        )
+    )
+    for i in range(35):
+        db.execute(
+            text(
+                "INSERT INTO sources"
+                " (id, user_id, name, agent_enabled, schedule_enabled,"
+                "  created_at, updated_at)"
+                f" VALUES ('s{i:02d}', 1, 'source', 0, 0,"
+                "  '2026-08-30 12:00:00', '2026-08-30 12:00:00')"
+            )
+        )
+    db.commit()
+    return db
+
+
+def _fetch_page(db: Session, cursor: str | None) -> tuple[list[Source], str | None]:
+    """Fetch one page the way the user_sources handler does."""
+    query = db.query(Source).filter(Source.user_id == 1)
+    position = decode_cursor(cursor) if cursor else None
+    if position is not None:
+        query = query.filter(keyset_filter(Source.updated_at, Source.id, position))
+
+    sources = (
+        query.order_by(Source.updated_at.desc(), Source.id.desc())
+        .limit(PER_PAGE + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(sources) > PER_PAGE:
+        sources = sources[:PER_PAGE]
+        last = sources[-1]
+        next_cursor = encode_cursor(last.updated_at, last.id)
+    return sources, next_cursor
+
+
+def test_same_second_rows_paginate_without_duplicates() -> None:
+    """Rows sharing one updated_at second split cleanly across pages.
+
+    Regression test: the cursor timestamp used to be bound as a Python
+    datetime, which SQLite renders with a microsecond suffix that sorts
+    after the stored second-precision text, so every same-second row
+    passed the filter and page two re-served rows from page one.
+    """
+    db = _make_session()
+
+    page_one, cursor = _fetch_page(db, None)
+    assert len(page_one) == PER_PAGE
+    assert cursor is not None
+
+    page_two, next_cursor = _fetch_page(db, cursor)
+    assert len(page_two) == 5
+    assert next_cursor is None
+
+    seen = [source.id for source in page_one + page_two]
+    assert len(set(seen)) == 35
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_cursor_round_trip_same_second() -> None:
+    """decode_cursor returns the exact stored-format timestamp text."""
+    db = _make_session()
+    last = (
+        db.query(Source)
+        .order_by(Source.updated_at.desc(), Source.id.desc())
+        .limit(1)
+        .one()
+    )
+    token = encode_cursor(last.updated_at, last.id)
+    assert decode_cursor(token) == ("2026-08-30 12:00:00", last.id)
+
+
+def test_decode_cursor_rejects_garbage() -> None:
+    """Malformed tokens decode to None instead of raising."""
+    assert decode_cursor("not-base64!") is None
+    assert decode_cursor("") is None
@@ -1,11 +1,12 @@
 """Route handlers for public feed access."""
 
-from pathlib import Path
+import os
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import FileResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
 from starlette.responses import Response as StarletteResponse
 
 from src.shared.config import settings
@@ -19,18 +20,14 @@ from src.web.auth import (
     user_has_puzzle_access,
     user_has_source_access,
 )
-from src.web.feed_utils import build_feed_data, paginate_items, sort_puzzles_by_date
+from src.web.feed_utils import build_feed_data
+from src.web.file_utils import cached_file_response
+from src.web.pagination_utils import page_bounds
+from src.web.templating import templates
 
 feed_router = APIRouter()
 
 
-def get_templates() -> Jinja2Templates:
-    """Get templates instance from main app."""
-    from src.web.main import templates  # type: ignore[attr-defined]
-
-    return templates
-
-
 @feed_router.get("/feeds/{id}.json")
 async def get_feed(
     id: str,
@@ -38,7 +35,7 @@ async def get_feed(
     page: int = 1,
     user: User = Depends(get_user_from_key),
     db: Session = Depends(get_db),
-) -> JSONResponse:
+) -> StarletteResponse:
     """Return a JSON feed for the given ID and key.
 
     ID can be either a short_code or a UUID.
@@ -55,44 +52,69 @@ async def get_feed(
         )
 
     base_url = get_base_url(request)
-    all_puzzles = sort_puzzles_by_date(source.puzzles)
-    puzzles, total_pages, validated_page = paginate_items(all_puzzles, page)
+    total_puzzles = (
+        db.query(func.count(Puzzle.id)).filter(Puzzle.source_id == source.id).scalar()
+    )
+    offset, total_pages, validated_page = page_bounds(total_puzzles, page)
+    puzzles = (
+        db.query(Puzzle)
+        .filter(Puzzle.source_id == source.id)
+        .order_by(
+            Puzzle.puzzle_date.desc().nullslast(),
+            Puzzle.created_at.desc(),
+            Puzzle.id.desc(),
+        )
+        .offset(offset)
+        .limit(50)
+        .all()
+    )
 
     feed_data = build_feed_data(
         source, puzzles, base_url, str(user.feed_key), validated_page, total_pages
     )
 
-    return JSONResponse(content=feed_data)
+    return StarletteResponse(
+        content=orjson.dumps(feed_data), media_type="application/json"
+    )
 
 
 @feed_router.get("/puzzles/{puzzle_id}.preview.png", response_class=FileResponse)
 async def get_puzzle_preview(
-    puzzle_id: str, db: Session = Depends(get_db)
+    puzzle_id: str, request: Request, db: Session = Depends(get_db)
 ) -> StarletteResponse:
     """Get puzzle preview image (public, no authentication required)."""
-    puzzle = db.query(Puzzle).filter(Puzzle.id == puzzle_id).first()
+    puzzle = db.get(Puzzle, puzzle_id)
     if not puzzle:
         raise HTTPException(status_code=404, detail="Puzzle not found")
 
-    preview_path = puzzle.preview_path()
-    if not preview_path.exists():
-        raise HTTPException(status_code=404, detail="Preview image not found")
-
-    return FileResponse(
-        path=preview_path,
+    preview_path = puzzle.preview_path_str()
+    try:
+        stat_result = os.stat(preview_path)
+    except OSError:
+        raise HTTPException(status_code=404, detail="Preview image not found") from None
+
+    # Previews are content-addressed by puzzle id and never rewritten, so
+    # clients can cache them indefinitely
+    return cached_file_response(
+        request,
+        preview_path,
+        stat_result,
         media_type="image/png",
-        headers={"Content-Disposition": "inline"},
+        max_age=31536000,
+        immutable=True,
+        inline=True,
     )
 
 
 @feed_router.get("/puzzles/{puzzle_id}.puz", response_class=FileResponse)
 async def download_puzzle_by_key(
     puzzle_id: str,
+    request: Request,
     user: User = Depends(get_user_from_key),
     db: Session = Depends(get_db),
 ) -> StarletteResponse:
     """Download a puzzle file using feed key authentication."""
-    puzzle = db.query(Puzzle).filter(Puzzle.id == puzzle_id).first()
+    puzzle = db.get(Puzzle, puzzle_id)
     if not puzzle:
         raise HTTPException(status_code=404, detail="Puzzle not found")
 
@@ -102,14 +124,20 @@ async def download_puzzle_by_key(
             detail="Access denied: User does not have access to this puzzle source",
         )
 
-    file_path = Path(puzzle.file_path)
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Puzzle file not found")
-
-    return FileResponse(
-        path=file_path,
-        filename=f"{puzzle.title}.puz",
+    try:
+        stat_result = os.stat(puzzle.file_path)
+    except OSError:
+        raise HTTPException(status_code=404, detail="Puzzle file not found") from None
+
+    # Puzzle files can be re-imported, so use a shorter max-age and rely on
+    # ETag revalidation after that
+    return cached_file_response(
+        request,
+        puzzle.file_path,
+        stat_result,
         media_type="application/x-crossword",
+        max_age=3600,
+        filename=f"{puzzle.title}.puz",
     )
 
 
@@ -121,7 +149,7 @@ async def puzzle_detail(
     db: Session = Depends(get_db),
 ) -> StarletteResponse:
     """Display puzzle detail page using feed key authentication."""
-    puzzle = db.query(Puzzle).filter(Puzzle.id == puzzle_id).first()
+    puzzle = db.get(Puzzle, puzzle_id, options=[joinedload(Puzzle.source)])
     if not puzzle:
         raise HTTPException(status_code=404, detail="Puzzle not found")
 
@@ -131,11 +159,10 @@ async def puzzle_detail(
             detail="Access denied: User does not have access to this puzzle source",
         )
 
-    source = db.query(Source).filter(Source.id == puzzle.source_id).first()
+    source = puzzle.source
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
 
-    templates = get_templates()
     return templates.TemplateResponse(
         "puzzle_detail.html",
         {
@@ -149,7 +176,7 @@ async def puzzle_detail(
 
 @feed_router.get("/sources/{folder_name}/icon.png", response_class=FileResponse)
 async def get_source_icon(
-    folder_name: str, db: Session = Depends(get_db)
+    folder_name: str, request: Request, db: Session = Depends(get_db)
 ) -> StarletteResponse:
     """Get a source icon file (public, no authentication required)."""
     source = Source.find_by_id_or_short_code(folder_name, db)
@@ -157,11 +184,17 @@ async def get_source_icon(
         return JSONResponse({"error": "Source not found"}, status_code=404)
 
     icon_path = settings.puzzles_path / source.folder_name / "icon.png"
-    if not icon_path.exists():
+    try:
+        stat_result = os.stat(icon_path)
+    except OSError:
         return JSONResponse({"error": "Icon not found"}, status_code=404)
 
-    return FileResponse(
-        path=icon_path,
+    # Icons can be replaced by re-upload, so keep the max-age modest
+    return cached_file_response(
+        request,
+        icon_path,
+        stat_result,
         media_type="image/png",
-        headers={"Content-Disposition": "inline"},
+        max_age=3600,
+        inline=True,
     )
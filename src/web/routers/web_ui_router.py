@@ -1,14 +1,18 @@
 """Route handlers for the web UI."""
 
-from pathlib import Path
+import json
+import os
+from datetime import UTC, datetime
 
+import orjson
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
 from starlette.responses import Response as StarletteResponse
 
 from src.agents.registry import AGENT_REGISTRY
+from src.shared.config import settings
 from src.shared.database import get_db
 from src.shared.models.agent_task import AgentTask
 from src.shared.models.puzzle import Puzzle
@@ -16,55 +20,67 @@ from src.shared.models.source import Source
 from src.shared.models.user import User
 from src.shared.request_utils import get_base_url
 from src.web.auth import (
+    get_user_by_username,
     get_user_from_session,
     has_any_users,
     hash_password,
+    invalidate_session_user,
     require_auth,
-    verify_password,
+    verify_and_update_password,
 )
-from src.web.feed_utils import paginate_items, sort_puzzles_by_date
-from src.web.pagination_utils import paginate
-from src.web.source_utils import normalize_short_code
+from src.web.file_utils import cached_file_response
+from src.web.pagination_utils import (
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    page_bounds,
+    render_cursor_pagination,
+    render_pagination,
+)
+from src.web.source_utils import normalize_short_code, scan_icon_folders
+from src.web.templating import templates
 
 web_ui_router = APIRouter()
 
-
-def get_templates() -> Jinja2Templates:
-    """Get templates instance from main app."""
-    from src.web.main import templates  # type: ignore[attr-defined]
-
-    return templates
+# The agent registry is fixed once discover_agents() runs at import, and
+# model_json_schema() walks the whole Pydantic model each call, so the
+# payload is built exactly once per process
+_AGENTS_PAYLOAD = [
+    {
+        "type": agent_info.type,
+        "name": agent_info.name,
+        "description": agent_info.description,
+        "config_schema": agent_info.config_schema.model_json_schema(),
+        "ui_hints": agent_info.ui_hints,
+        "presets": agent_info.presets,
+    }
+    for agent_info in AGENT_REGISTRY.values()
+]
+_AGENTS_RESPONSE_BYTES = orjson.dumps({"agents": _AGENTS_PAYLOAD})
 
 
 @web_ui_router.get("/api/agents")
 @require_auth
-async def list_agents(request: Request) -> dict:
+async def list_agents(request: Request) -> StarletteResponse:
     """Return list of available agents with their config schemas."""
-    agents = []
-    for agent_info in AGENT_REGISTRY.values():
-        agents.append(
-            {
-                "type": agent_info.type,
-                "name": agent_info.name,
-                "description": agent_info.description,
-                "config_schema": agent_info.config_schema.model_json_schema(),
-                "ui_hints": agent_info.ui_hints,
-                "presets": agent_info.presets,
-            }
-        )
-    return {"agents": agents}
+    return StarletteResponse(
+        content=_AGENTS_RESPONSE_BYTES, media_type="application/json"
+    )
 
 
 @web_ui_router.get("/api/sources/short-codes")
 @require_auth
 async def list_user_short_codes(
     request: Request, db: Session = Depends(get_db)
-) -> dict:
+) -> StarletteResponse:
     """Return list of short codes for the current user's sources."""
     user = get_user_from_session(request, db)
     sources = db.query(Source).filter(Source.user_id == user.id).all()
     short_codes = [s.short_code for s in sources if s.short_code]
-    return {"short_codes": short_codes}
+    return StarletteResponse(
+        content=orjson.dumps({"short_codes": short_codes}),
+        media_type="application/json",
+    )
 
 
 @web_ui_router.get("/", response_class=HTMLResponse)
@@ -80,7 +96,6 @@ async def home(request: Request, db: Session = Depends(get_db)) -> StarletteResp
         # No users exist, redirect to user creation
         return RedirectResponse(url="/users/new", status_code=303)
 
-    templates = get_templates()
     return templates.TemplateResponse("index.html", {"request": request})
 
 
@@ -93,19 +108,29 @@ async def login(
 ) -> StarletteResponse:
     """Handle login form submission."""
     # Query user from database
-    user = db.query(User).filter(User.username == username).first()
+    user = get_user_by_username(db, username)
 
     # Check if user exists and password is correct
-    if user and verify_password(password, user.password_hash):
+    if user:
+        valid, new_hash = verify_and_update_password(password, user.password_hash)
+    else:
+        valid, new_hash = False, None
+
+    if user and valid:
+        # Upgrade legacy pbkdf2 hashes to Argon2id on successful login
+        if new_hash:
+            user.password_hash = new_hash
+            db.commit()
+
         # Set session
         request.session["logged_in"] = True
         request.session["username"] = username
         request.session["user_id"] = user.id
 
         # Check if user has sources
-        has_sources = (
-            db.query(Source).filter(Source.user_id == user.id).first() is not None
-        )
+        has_sources = db.query(
+            db.query(Source).filter(Source.user_id == user.id).exists()
+        ).scalar()
 
         # Redirect to feed if they have sources, otherwise to sources page
         if has_sources:
@@ -114,7 +139,6 @@ async def login(
             return RedirectResponse(url=f"/user/{username}/sources", status_code=303)
 
     # Invalid credentials - show login page with error
-    templates = get_templates()
     return templates.TemplateResponse(
         "index.html", {"request": request, "error": "Invalid username or password"}
     )
@@ -123,6 +147,9 @@ async def login(
 @web_ui_router.get("/logout")
 async def logout(request: Request) -> StarletteResponse:
     """Log out the user and redirect to login page."""
+    user_id = request.session.get("user_id")
+    if user_id:
+        invalidate_session_user(user_id)
     request.session.clear()
     return RedirectResponse(url="/", status_code=303)
 
@@ -135,7 +162,6 @@ async def new_user_form(
     if has_any_users(db):
         return RedirectResponse(url="/", status_code=303)
 
-    templates = get_templates()
     return templates.TemplateResponse("new_user.html", {"request": request})
 
 
@@ -152,21 +178,18 @@ async def create_user(
         return RedirectResponse(url="/", status_code=303)
 
     if password != confirm_password:
-        templates = get_templates()
         return templates.TemplateResponse(
             "new_user.html", {"request": request, "error": "Passwords do not match"}
         )
 
     if len(password) < 6:
-        templates = get_templates()
         return templates.TemplateResponse(
             "new_user.html",
             {"request": request, "error": "Password must be at least 6 characters"},
         )
 
-    existing_user = db.query(User).filter(User.username == username).first()
+    existing_user = get_user_by_username(db, username)
     if existing_user:
-        templates = get_templates()
         return templates.TemplateResponse(
             "new_user.html",
             {"request": request, "error": "Username already exists"},
@@ -175,7 +198,6 @@ async def create_user(
     new_user = User(username=username, password_hash=hash_password(password))
     db.add(new_user)
     db.commit()
-    db.refresh(new_user)
 
     request.session["logged_in"] = True
     request.session["username"] = username
@@ -187,33 +209,48 @@ async def create_user(
 @web_ui_router.get("/user/{id}/sources", response_class=HTMLResponse)
 @require_auth
 async def user_sources(
-    request: Request, id: str, page: int = 1, db: Session = Depends(get_db)
+    request: Request, id: str, cursor: str | None = None, db: Session = Depends(get_db)
 ) -> StarletteResponse:
     """Display user's available sources."""
     user = get_user_from_session(request, db)
 
-    query = (
-        db.query(Source)
-        .filter(Source.user_id == user.id)
-        .order_by(Source.updated_at.desc())
+    # Keyset pagination on (updated_at, id): each page is an index seek
+    # bounded by per_page, regardless of how deep the reader has paged
+    per_page = 30
+    query = db.query(Source).filter(Source.user_id == user.id)
+
+    position = decode_cursor(cursor) if cursor else None
+    if position is not None:
+        query = query.filter(keyset_filter(Source.updated_at, Source.id, position))
+
+    sources = (
+        query.order_by(Source.updated_at.desc(), Source.id.desc())
+        .limit(per_page + 1)
+        .all()
     )
-    all_sources = query.all()
 
-    per_page = 30
-    sources, total_pages, validated_page = paginate(all_sources, page, per_page)
+    next_cursor = None
+    if len(sources) > per_page:
+        sources = sources[:per_page]
+        last = sources[-1]
+        next_cursor = encode_cursor(last.updated_at, last.id)
 
     base_url = get_base_url(request)
 
-    templates = get_templates()
+    # One directory scan instead of an icon stat per listed source
+    icon_folders = scan_icon_folders()
+
     return templates.TemplateResponse(
         "user_sources.html",
         {
             "request": request,
             "sources": sources,
-            "page": validated_page,
-            "total_pages": total_pages,
             "user_id": id,
             "base_url": base_url,
+            "icon_folders": icon_folders,
+            "pagination_html": render_cursor_pagination(
+                f"/user/{id}/sources", next_cursor, position is None
+            ),
         },
     )
 
@@ -226,50 +263,46 @@ async def user_feeds_new(
     """Display all user's puzzles in reverse chronological order, 7 days per page."""
     user = get_user_from_session(request, db)
 
-    all_puzzles = db.query(Puzzle).join(Source).filter(Source.user_id == user.id).all()
-    sorted_puzzles = sort_puzzles_by_date(all_puzzles)
-
-    if not sorted_puzzles:
-        templates = get_templates()
-        return templates.TemplateResponse(
-            "user_feeds_new.html",
-            {
-                "request": request,
-                "puzzles": [],
-                "page": 1,
-                "total_pages": 1,
-                "user_id": id,
-            },
-        )
+    # Effective date of a puzzle: its puzzle_date, or the day it was imported
+    date_expr = Puzzle.effective_date
 
-    # Group puzzles by date
-    from collections import defaultdict
-
-    puzzles_by_date = defaultdict(list)
-    for puzzle in sorted_puzzles:
-        puzzle_date = (
-            puzzle.puzzle_date if puzzle.puzzle_date else puzzle.created_at.date()
-        )
-        puzzles_by_date[puzzle_date].append(puzzle)
-
-    # Get unique dates in order
-    unique_dates = sorted(puzzles_by_date.keys(), reverse=True)
+    # Page by distinct days in SQL so only the 7 rendered days' puzzles
+    # are ever fetched, instead of the user's whole history
+    total_days = (
+        db.query(func.count(func.distinct(date_expr)))
+        .select_from(Puzzle)
+        .join(Source)
+        .filter(Source.user_id == user.id)
+        .scalar()
+    )
 
-    # Paginate by 7 days at a time
     days_per_page = 7
-    total_pages = (len(unique_dates) + days_per_page - 1) // days_per_page
-    validated_page = max(1, min(page, total_pages))
+    offset, total_pages, validated_page = page_bounds(total_days, page, days_per_page)
 
-    start_idx = (validated_page - 1) * days_per_page
-    end_idx = start_idx + days_per_page
-    page_dates = unique_dates[start_idx:end_idx]
+    page_dates = [
+        row[0]
+        for row in db.query(date_expr)
+        .select_from(Puzzle)
+        .join(Source)
+        .filter(Source.user_id == user.id)
+        .distinct()
+        .order_by(date_expr.desc())
+        .offset(offset)
+        .limit(days_per_page)
+        .all()
+    ]
 
-    # Get all puzzles for the dates on this page
     page_puzzles = []
-    for puzzle_date in page_dates:
-        page_puzzles.extend(puzzles_by_date[puzzle_date])
+    if page_dates:
+        page_puzzles = (
+            db.query(Puzzle)
+            .join(Source)
+            .filter(Source.user_id == user.id, date_expr.in_(page_dates))
+            .options(selectinload(Puzzle.source))
+            .order_by(date_expr.desc(), Puzzle.created_at.desc())
+            .all()
+        )
 
-    templates = get_templates()
     return templates.TemplateResponse(
         "user_feeds_new.html",
         {
@@ -286,7 +319,6 @@ async def user_feeds_new(
 @require_auth
 async def new_source(request: Request) -> StarletteResponse:
     """Display form for creating a new source."""
-    templates = get_templates()
     username = request.session.get("username")
     return templates.TemplateResponse(
         "new_source.html", {"request": request, "username": username}
@@ -297,7 +329,6 @@ async def new_source(request: Request) -> StarletteResponse:
 @require_auth
 async def new_source_custom(request: Request) -> StarletteResponse:
     """Display form for creating a custom source."""
-    templates = get_templates()
     username = request.session.get("username")
     return templates.TemplateResponse(
         "new_source_custom.html", {"request": request, "username": username}
@@ -313,7 +344,6 @@ async def create_preset_source(
     db: Session = Depends(get_db),
 ) -> StarletteResponse:
     """Create a new source from a preset configuration."""
-    import json
 
     user = get_user_from_session(request, db)
 
@@ -343,13 +373,11 @@ async def create_preset_source(
         schedule_interval_hours=schedule_interval_hours,
     )
     db.add(source)
-    db.commit()
-    db.refresh(source)
+    # Flush assigns source.id; committing once keeps the source and its
+    # first run in a single transaction (and a single fsync)
+    db.flush()
 
     # Queue an immediate first run
-    from datetime import UTC, datetime
-
-    from src.shared.models.agent_task import AgentTask
 
     task = AgentTask(source_id=source.id, status="pending")
     db.add(task)
@@ -401,19 +429,16 @@ async def create_source(
         schedule_interval_hours=final_schedule_interval_hours,
     )
     db.add(source)
-    db.commit()
-    db.refresh(source)
+    db.flush()
 
-    # If scheduling is enabled, queue an immediate first run
+    # If scheduling is enabled, queue an immediate first run in the same
+    # transaction as the source itself
     if final_schedule_enabled and final_agent_type and agent_enabled:
-        from datetime import UTC, datetime
-
-        from src.shared.models.agent_task import AgentTask
-
         task = AgentTask(source_id=source.id, status="pending")
         db.add(task)
         source.last_scheduled_run_at = datetime.now(UTC)
-        db.commit()
+
+    db.commit()
 
     return RedirectResponse(url=f"/sources/{source.id}", status_code=303)
 
@@ -426,13 +451,31 @@ async def source_detail(
     """Display source information page."""
     user = get_user_from_session(request, db)
 
-    source = db.query(Source).filter(Source.id == id).first()
+    source = db.get(Source, id)
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
 
-    all_puzzles = sort_puzzles_by_date(source.puzzles)
+    total_puzzles, latest_puzzle_date = (
+        db.query(func.count(Puzzle.id), func.max(Puzzle.puzzle_date))
+        .filter(Puzzle.source_id == id)
+        .one()
+    )
+
     per_page = 30
-    puzzles, total_pages, validated_page = paginate_items(all_puzzles, page, per_page)
+    offset, total_pages, validated_page = page_bounds(total_puzzles, page, per_page)
+
+    puzzles = (
+        db.query(Puzzle)
+        .filter(Puzzle.source_id == id)
+        .order_by(
+            Puzzle.puzzle_date.desc().nullslast(),
+            Puzzle.created_at.desc(),
+            Puzzle.id.desc(),
+        )
+        .offset(offset)
+        .limit(per_page)
+        .all()
+    )
 
     feed_identifier = source.short_code if source.short_code else source.id
 
@@ -444,21 +487,21 @@ async def source_detail(
         .first()
     )
 
-    # Check if there's a running or pending agent task
-    has_running_agent = (
+    # Check if there's a running or pending agent task; EXISTS lets the
+    # database short-circuit without hydrating a row
+    has_running_agent = db.query(
         db.query(AgentTask)
         .filter(AgentTask.source_id == id, AgentTask.status.in_(["pending", "running"]))
-        .first()
-    ) is not None
+        .exists()
+    ).scalar()
 
-    templates = get_templates()
     return templates.TemplateResponse(
         "source_detail.html",
         {
             "request": request,
             "source_title": source.name,
-            "latest_puzzle_date": all_puzzles[0].puzzle_date if all_puzzles else "N/A",
-            "total_puzzles": len(all_puzzles),
+            "latest_puzzle_date": latest_puzzle_date if latest_puzzle_date else "N/A",
+            "total_puzzles": total_puzzles,
             "errors": 0,
             "feed_url": f"/feeds/{feed_identifier}.json?key={user.feed_key}",
             "feed_key": str(user.feed_key),
@@ -472,6 +515,9 @@ async def source_detail(
             "next_run_at": source.next_run_at,
             "has_running_agent": has_running_agent,
             "has_icon": source.has_icon,
+            "pagination_html": render_pagination(
+                validated_page, total_pages, f"/sources/{id}"
+            ),
         },
     )
 
@@ -485,9 +531,8 @@ async def upload_source_icon(
     db: Session = Depends(get_db),
 ) -> StarletteResponse:
     """Upload an icon for a source."""
-    from src.shared.config import settings
 
-    source = db.query(Source).filter(Source.id == id).first()
+    source = db.get(Source, id)
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
 
@@ -510,21 +555,29 @@ async def agent_detail(
     request: Request, id: str, page: int = 1, db: Session = Depends(get_db)
 ) -> StarletteResponse:
     """Display agent runs for a source."""
-    source = db.query(Source).filter(Source.id == id).first()
+    source = db.get(Source, id)
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
 
-    all_runs = (
+    total_runs = (
+        db.query(func.count(AgentTask.id)).filter(AgentTask.source_id == id).scalar()
+    )
+
+    per_page = 30
+    offset, total_pages, validated_page = page_bounds(total_runs, page, per_page)
+
+    runs = (
         db.query(AgentTask)
         .filter(AgentTask.source_id == id)
-        .order_by(AgentTask.queued_at.desc())
+        .order_by(AgentTask.queued_at.desc(), AgentTask.id.desc())
+        .offset(offset)
+        .limit(per_page)
         .all()
     )
 
-    per_page = 30
-    runs, total_pages, validated_page = paginate(all_runs, page, per_page)
-
-    runs_with_duration = []
+    # Attach the formatted duration to each row; Jinja reads attributes,
+    # so there is no need to copy the instance dict (which would also
+    # drag _sa_instance_state into the template context)
     for run in runs:
         duration = None
         if run.started_at and run.completed_at:
@@ -536,9 +589,8 @@ async def agent_detail(
                 duration = f"{minutes}m {seconds}s"
             else:
                 duration = f"{seconds}s"
-        runs_with_duration.append({"duration": duration, **run.__dict__})
+        run.duration = duration
 
-    templates = get_templates()
     return templates.TemplateResponse(
         "agent_detail.html",
         {
@@ -550,8 +602,8 @@ async def agent_detail(
             "schedule_interval_hours": source.schedule_interval_hours,
             "last_scheduled_run_at": source.last_scheduled_run_at,
             "next_run_at": source.next_run_at,
-            "total_runs": len(all_runs),
-            "runs": runs_with_duration,
+            "total_runs": total_runs,
+            "runs": runs,
             "source_id": id,
             "page": validated_page,
             "total_pages": total_pages,
@@ -568,7 +620,7 @@ async def enqueue_agent_run(
     db: Session = Depends(get_db),
 ) -> StarletteResponse:
     """Enqueue an agent run for a source."""
-    source = db.query(Source).filter(Source.id == source_id).first()
+    source = db.get(Source, source_id)
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
 
@@ -590,16 +642,12 @@ async def agent_run_detail(
     request: Request, run_id: str, db: Session = Depends(get_db)
 ) -> StarletteResponse:
     """Display details and logs for a specific agent run."""
-    import json
-    from datetime import datetime
-
-    from src.shared.config import settings
 
-    run = db.query(AgentTask).filter(AgentTask.id == run_id).first()
+    run = db.get(AgentTask, run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Agent run not found")
 
-    source = db.query(Source).filter(Source.id == run.source_id).first()
+    source = db.get(Source, run.source_id)
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
 
@@ -614,18 +662,26 @@ async def agent_run_detail(
         )
 
         if log_file_path.exists():
-            with open(log_file_path) as f:
-                log_data = json.load(f)
+            with open(log_file_path, "rb") as f:
+                log_data = orjson.loads(f.read())
 
             if log_data and "logs" in log_data:
+                # Consecutive log lines usually share a timestamp string;
+                # parse each distinct value once instead of per line
+                parsed: dict = {}
                 for log in log_data["logs"]:
-                    if "timestamp" in log:
+                    raw = log.get("timestamp")
+                    if raw is None:
+                        continue
+                    value = parsed.get(raw)
+                    if value is None:
                         try:
-                            log["timestamp"] = datetime.fromisoformat(log["timestamp"])
+                            value = datetime.fromisoformat(raw)
                         except (ValueError, TypeError):
-                            pass
+                            value = raw
+                        parsed[raw] = value
+                    log["timestamp"] = value
 
-    templates = get_templates()
     return templates.TemplateResponse(
         "agent_run_detail.html",
         {
@@ -640,19 +696,27 @@ async def agent_run_detail(
 @web_ui_router.get("/puzzles/{puzzle_id}/download", response_class=FileResponse)
 @require_auth
 async def download_puzzle(
-    puzzle_id: str, db: Session = Depends(get_db)
+    puzzle_id: str, request: Request, db: Session = Depends(get_db)
 ) -> StarletteResponse:
     """Download a puzzle file."""
-    puzzle = db.query(Puzzle).filter(Puzzle.id == puzzle_id).first()
+    puzzle = db.get(Puzzle, puzzle_id)
     if not puzzle:
         raise HTTPException(status_code=404, detail="Puzzle not found")
 
-    file_path = Path(puzzle.file_path)
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Puzzle file not found")
-
-    return FileResponse(
-        path=file_path,
-        filename=f"{puzzle.title}.puz",
+    # Stat once and reuse: FileResponse skips its own stat call, and the
+    # kernel handles the byte copy from page cache to socket.
+    try:
+        stat_result = os.stat(puzzle.file_path)
+    except OSError:
+        raise HTTPException(status_code=404, detail="Puzzle file not found") from None
+
+    # Session-authenticated download, so caching is private to the client
+    return cached_file_response(
+        request,
+        puzzle.file_path,
+        stat_result,
         media_type="application/x-crossword",
+        max_age=3600,
+        private=True,
+        filename=f"{puzzle.title}.puz",
     )
@@ -1,17 +1,66 @@
 """Utilities for source management."""
 
+import os
+import re
+
+from fastapi import HTTPException
+
+from src.shared.config import settings
+
+# Compiled once; rejects obviously invalid codes before they reach the
+# database's unique index (whose failure mode is an unhandled 500)
+_SHORT_CODE_RE = re.compile(r"\A[a-zA-Z0-9_-]{1,32}\Z")
+
+
+def scan_icon_folders() -> set[str]:
+    """Scan the puzzles directory once for source folders containing an icon.
+
+    One directory walk replaces a per-source stat when rendering source
+    listings.
+
+    Returns:
+        Set of folder names that contain an icon.png
+    """
+    icon_folders: set[str] = set()
+    try:
+        entries = os.scandir(settings.puzzles_path_str)
+    except FileNotFoundError:
+        return icon_folders
+    with entries:
+        for entry in entries:
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, "icon.png")):
+                icon_folders.add(entry.name)
+    return icon_folders
+
 
 def normalize_short_code(short_code: str | None) -> str | None:
-    """Normalize a short code by stripping whitespace.
+    """Normalize and validate a short code.
 
     Args:
         short_code: The short code to normalize
 
     Returns:
         Normalized short code or None if empty
+
+    Raises:
+        HTTPException: If the short code contains invalid characters
     """
     if not short_code:
         return None
 
+    # Fast path: the pattern excludes whitespace, so a match means there
+    # is nothing to strip
+    if _SHORT_CODE_RE.match(short_code):
+        return short_code
+
     short_code = short_code.strip()
-    return short_code if short_code else None
+    if not short_code:
+        return None
+
+    if not _SHORT_CODE_RE.match(short_code):
+        raise HTTPException(
+            status_code=422,
+            detail="Short code must be 1-32 letters, digits, hyphens, or underscores",
+        )
+
+    return short_code
@@ -0,0 +1,22 @@
+"""Shared Jinja2 templates instance for the web app.
+
+Routers import this module-level instance directly instead of re-importing
+it from src.web.main on every request.
+"""
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from src.shared.config import settings
+
+templates = Jinja2Templates(directory="src/web/templates")
+
+# Persist compiled template bytecode across process restarts so renders
+# skip the lexer/parser/compile step after the first hit.
+_bytecode_cache_dir = settings.DATA_PATH / "jinja_cache"
+_bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+templates.env.bytecode_cache = FileSystemBytecodeCache(str(_bytecode_cache_dir))
+
+if settings.PROD:
+    # Skip per-render template mtime checks in production
+    templates.env.auto_reload = False